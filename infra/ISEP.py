@@ -7,7 +7,7 @@ and service discovery between Symphony nodes.
 
 from typing import Dict, List, Optional
 import time
-from queue import Queue
+from queue import Empty, Queue
 from protocol.beacon import Beacon
 from protocol.response import BeaconResponse
 from protocol.task_contract import TaskResult, Task
@@ -195,7 +195,9 @@ class ISEPClient:
         """
         try:
             return self.beacon_queue.get(timeout=timeout)
-        except Exception:
+        except Empty:
+            # The empty-queue timeout is the normal idle case; anything
+            # else is a real error and should propagate
             return None, None, None
 
     def receive_task(self, timeout=None):
@@ -209,7 +211,9 @@ class ISEPClient:
         """
         try:
             return self.subtask_queue.get(timeout=timeout)
-        except Exception:
+        except Empty:
+            # The empty-queue timeout is the normal idle case; anything
+            # else is a real error and should propagate
             return None, None, None
         
     def receive_result(self, timeout=None):
@@ -223,5 +227,7 @@ class ISEPClient:
         """
         try:
             return self.task_result_queue.get(timeout=timeout)
-        except Exception:
+        except Empty:
+            # The empty-queue timeout is the normal idle case; anything
+            # else is a real error and should propagate
             return None, None, None
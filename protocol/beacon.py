@@ -41,7 +41,7 @@ class Beacon:
             task_id: Task identifier. Defaults to beacon_id if not provided
             ttl: Time-to-live hop count for propagation control. Defaults to 2
         """
-        self.beacon_id = str(uuid.uuid4())
+        self.beacon_id = uuid.uuid4().hex
         self.sender = sender
         self.task_id = task_id or self.beacon_id
         self.requirement = requirement
@@ -79,7 +79,7 @@ class Beacon:
             task_id=data.get("task_id"),
             ttl=data.get("ttl", 2)
         )
-        beacon.beacon_id = data.get("beacon_id", str(uuid.uuid4()))
+        beacon.beacon_id = data.get("beacon_id", uuid.uuid4().hex)
         beacon.timestamp = data.get("timestamp", int(time.time()))
         return beacon
 
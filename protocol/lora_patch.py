@@ -43,7 +43,7 @@ class LoRAPatch:
             layer_names: List of LoRA layer names being updated
             is_sparse: Whether to use sparse representation for the patch
         """
-        self.patch_id = str(uuid.uuid4())
+        self.patch_id = uuid.uuid4().hex
         self.source_id = source_id
         self.patch_path = patch_path
         self.layer_names = layer_names
@@ -81,7 +81,7 @@ class LoRAPatch:
             layer_names=data.get("layer_names", []),
             is_sparse=data.get("is_sparse", False)
         )
-        patch.patch_id = data.get("patch_id", str(uuid.uuid4()))
+        patch.patch_id = data.get("patch_id", uuid.uuid4().hex)
         patch.timestamp = data.get("timestamp", int(time.time()))
         return patch
 
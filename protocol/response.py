@@ -41,7 +41,7 @@ class BeaconResponse:
             match_score: Matching score with task requirements (0.0 to 1.0)
             estimate_cost: Estimated cost of executing the task
         """
-        self.response_id = str(uuid.uuid4())
+        self.response_id = uuid.uuid4().hex
         self.responder_id = responder_id
         self.task_id = task_id
         self.match_score = round(max(0.0, min(1.0, match_score)), 3)
@@ -79,7 +79,7 @@ class BeaconResponse:
             match_score=data.get("match_score", 1.0),
             estimate_cost=data.get("estimate_cost", 1.0)
         )
-        resp.response_id = data.get("response_id", str(uuid.uuid4()))
+        resp.response_id = data.get("response_id", uuid.uuid4().hex)
         resp.timestamp = data.get("timestamp", int(time.time()))
         return resp
 
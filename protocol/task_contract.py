@@ -9,14 +9,35 @@ import uuid
 import time
 from typing import Dict, Any, List
 
+# Try to import numpy for zero-copy tensor payload handling, fallback
+# gracefully if not available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 __all__ = ['Task', 'TaskResult']
 
+# Defaults for the legacy fields shared by both Task constructor branches.
+# Mutable defaults are stored as factories so instances never share state.
+_TASK_DEFAULTS = (
+    ("subtask_id", 0),
+    ("steps", dict),
+    ("previous_results", list),
+    ("original_problem", ""),
+    ("final_result", ""),
+    ("user_id", "symphony_user"),
+)
+
 
 class TaskResult:
     """Task execution result container.
     
     Encapsulates the result of a task execution, including metadata
-    about the executing and target nodes.
+    about the executing and target nodes. Numeric array results are
+    serialized as raw bytes with a shape/dtype sidecar instead of
+    per-element Python containers, so tensor payloads cross the wire
+    without element-wise object construction.
     
     Attributes:
         target_id (str): Target node identifier
@@ -48,9 +69,23 @@ class TaskResult:
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary format for serialization.
         
+        Numpy array results are emitted as raw bytes plus shape/dtype
+        metadata so encoders that support a raw-bytes type can transmit
+        them zero-copy.
+        
         Returns:
             Dictionary representation of the task result
         """
+        if np is not None and isinstance(self.result, np.ndarray):
+            return {
+                "target_id": self.target_id,
+                "executer_id": self.executer_id,
+                "result": None,
+                "result_bytes": self.result.tobytes(),
+                "result_shape": tuple(self.result.shape),
+                "result_dtype": str(self.result.dtype),
+                "previous_results": self.previous_results
+            }
         return {
             "target_id": self.target_id,
             "executer_id": self.executer_id,
@@ -68,10 +103,16 @@ class TaskResult:
         Returns:
             TaskResult instance created from the dictionary
         """
+        result = data["result"]
+        if result is None and data.get("result_bytes") is not None and np is not None:
+            # Reconstruct the array view directly over the received buffer
+            result = np.frombuffer(
+                data["result_bytes"], dtype=data["result_dtype"]
+            ).reshape(data["result_shape"])
         return TaskResult(
             target_id=data["target_id"],
             executer_id=data["executer_id"],
-            result=data["result"],
+            result=result,
             previous_results=data["previous_results"]
         )
 
@@ -139,41 +180,45 @@ class Task:
             final_result: Final result (legacy)
             user_id: User identifier (legacy)
         """
+        # Legacy fields are common to both API modes; fill them in a single
+        # table-driven pass instead of duplicating the writes per branch.
+        given = {
+            "subtask_id": subtask_id,
+            "steps": steps,
+            "previous_results": previous_results,
+            "original_problem": original_problem,
+            "final_result": final_result,
+            "user_id": user_id,
+        }
+        for attr, default in _TASK_DEFAULTS:
+            value = given[attr]
+            if not value:
+                value = default() if callable(default) else default
+            setattr(self, attr, value)
+
         # Determine which API is being used
         if description is not None or requirements is not None:
             # New high-level API
-            self.task_id = task_id or str(uuid.uuid4())
+            self.task_id = task_id or uuid.uuid4().hex
             self.description = description or ""
             self.requirements = requirements or []
             self.context = context or {}
-            
-            # Set legacy fields for backward compatibility
-            self.subtask_id = subtask_id or 0
-            self.steps = steps or {}
-            self.previous_results = previous_results or []
-            self.original_problem = original_problem or description or ""
-            self.final_result = final_result or ""
-            self.user_id = user_id or "symphony_user"
-            
+            if not self.original_problem:
+                self.original_problem = self.description
+
             # Flag to indicate which API was used
-            self._api_mode = "high_level"
+            self._high_level = True
         else:
-            # Legacy low-level API
-            self.subtask_id = subtask_id or 0
-            self.steps = steps or {}
-            self.previous_results = previous_results or []
-            self.original_problem = original_problem or ""
-            self.final_result = final_result or ""
-            self.user_id = user_id or "symphony_user"
-            
-            # Set new API fields from legacy data
-            self.task_id = str(uuid.uuid4())
-            self.description = original_problem or ""
-            self.requirements = list(steps.keys()) if isinstance(steps, dict) else []
+            # Legacy low-level API: derive the new API fields from legacy data
+            self.task_id = uuid.uuid4().hex
+            self.description = self.original_problem
+            # steps is already normalized to a dict above; iterating it
+            # yields the keys directly
+            self.requirements = list(self.steps)
             self.context = {"mode": "legacy"}
-            
+
             # Flag to indicate which API was used
-            self._api_mode = "legacy"
+            self._high_level = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert Task object to dictionary format for JSON serialization.
@@ -190,14 +235,14 @@ class Task:
             "user_id": self.user_id
         }
         
-        # Add new API fields if available
-        if hasattr(self, 'task_id'):
+        # Add new API fields for high-level tasks
+        if self._high_level:
             base_dict.update({
                 "task_id": self.task_id,
                 "description": self.description,
                 "requirements": self.requirements,
                 "context": self.context,
-                "api_mode": getattr(self, '_api_mode', 'legacy')
+                "api_mode": "high_level"
             })
         
         return base_dict
@@ -239,7 +284,7 @@ class Task:
     
     def __repr__(self) -> str:
         """Return string representation of the task."""
-        if hasattr(self, '_api_mode') and self._api_mode == 'high_level':
+        if self._high_level:
             return f"<Task '{self.description[:30]}...' requirements={len(self.requirements)}>"
         else:
             return f"<Task subtask_id={self.subtask_id} user_id='{self.user_id}'>"
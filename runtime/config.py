@@ -8,6 +8,13 @@ import os
 import yaml
 from typing import Dict, Any, List, Tuple
 
+# Try to import msgspec for C-level schema validation, fallback to the
+# hand-coded checks in validate_config if not available
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 
 # Default configuration template
 DEFAULT_CONFIG: Dict[str, Any] = {
@@ -111,11 +118,40 @@ def get_config() -> Dict[str, Any]:
     return DEFAULT_CONFIG.copy()
 
 
+if msgspec is not None:
+    class P2PConfigSchema(msgspec.Struct):
+        """Schema for the p2p section of the node configuration."""
+        port: int = 7788
+        enable_dht: bool = False
+        beacon_ttl: int = 2
+        heartbeat_interval: int = 15
+
+    class NetworkConfigSchema(msgspec.Struct):
+        """Schema for the network adapter section of the node configuration."""
+        port: int
+        host: str = "127.0.0.1"
+
+    class LoRAConfigSchema(msgspec.Struct):
+        """Schema for the LoRA storage section of the node configuration."""
+        save_dir: str = "checkpoints/"
+        patch_interval: int = 300
+
+    class SymphonyConfigSchema(msgspec.Struct):
+        """Schema covering the fields required of every node configuration."""
+        node_id: str
+        role: str
+        network: NetworkConfigSchema
+        p2p: P2PConfigSchema
+        lora: LoRAConfigSchema = msgspec.field(default_factory=LoRAConfigSchema)
+
+
 def validate_config(config: Dict[str, Any]) -> bool:
     """Validate configuration parameters.
     
     Checks if the provided configuration contains all required fields
-    and has valid values for critical parameters.
+    and has valid values for critical parameters. When msgspec is
+    installed the whole check runs as a single C-level schema pass;
+    otherwise a hand-coded fallback covers the same required fields.
     
     Args:
         config (Dict[str, Any]): Configuration dictionary to validate
@@ -123,6 +159,14 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Returns:
         bool: True if configuration is valid, False otherwise
     """
+    if msgspec is not None:
+        try:
+            msgspec.convert(config, SymphonyConfigSchema)
+            return True
+        except msgspec.ValidationError as e:
+            print(f"[Config] Invalid configuration: {e}")
+            return False
+
     required_fields = ["node_id", "role", "network", "p2p"]
     
     for field in required_fields:
@@ -12,6 +12,15 @@ from typing import Optional
 # Default log level
 DEFAULT_LOG_LEVEL = logging.INFO
 
+# Mapping from level names to logging constants, built once at import
+_LEVEL_MAP = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
 # Configure basic logging
 logging.basicConfig(
     level=DEFAULT_LOG_LEVEL,
@@ -23,6 +32,9 @@ logging.basicConfig(
 # Create logger instance
 logger = logging.getLogger("symphony")
 
+# Cache the root logger handle so set_level avoids a registry lookup
+_root_logger = logging.getLogger()
+
 
 def set_level(level: str) -> None:
     """Set the logging level.
@@ -34,64 +46,66 @@ def set_level(level: str) -> None:
                     'debug', 'info', 'warning', 'error', 'critical'
                     Case-insensitive.
     """
-    level_map = {
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL,
-    }
-    
-    log_level = level_map.get(level.lower(), logging.INFO)
+    log_level = _LEVEL_MAP.get(level.lower(), logging.INFO)
     logger.setLevel(log_level)
     
     # Also update the root logger level
-    logging.getLogger().setLevel(log_level)
+    _root_logger.setLevel(log_level)
 
 
-def info(msg: str) -> None:
+def info(msg: str, *args: object) -> None:
     """Log an info level message.
     
     Args:
-        msg (str): Message to log
+        msg (str): Message to log, optionally with %-style placeholders
+        *args: Arguments for lazy %-formatting, applied only if the
+               message is actually emitted at the current log level
     """
-    logger.info(msg)
+    logger.info(msg, *args)
 
 
-def debug(msg: str) -> None:
+def debug(msg: str, *args: object) -> None:
     """Log a debug level message.
     
     Args:
-        msg (str): Message to log
+        msg (str): Message to log, optionally with %-style placeholders
+        *args: Arguments for lazy %-formatting, applied only if the
+               message is actually emitted at the current log level
     """
-    logger.debug(msg)
+    logger.debug(msg, *args)
 
 
-def warning(msg: str) -> None:
+def warning(msg: str, *args: object) -> None:
     """Log a warning level message.
     
     Args:
-        msg (str): Message to log
+        msg (str): Message to log, optionally with %-style placeholders
+        *args: Arguments for lazy %-formatting, applied only if the
+               message is actually emitted at the current log level
     """
-    logger.warning(msg)
+    logger.warning(msg, *args)
 
 
-def error(msg: str) -> None:
+def error(msg: str, *args: object) -> None:
     """Log an error level message.
     
     Args:
-        msg (str): Message to log
+        msg (str): Message to log, optionally with %-style placeholders
+        *args: Arguments for lazy %-formatting, applied only if the
+               message is actually emitted at the current log level
     """
-    logger.error(msg)
+    logger.error(msg, *args)
 
 
-def critical(msg: str) -> None:
+def critical(msg: str, *args: object) -> None:
     """Log a critical level message.
     
     Args:
-        msg (str): Message to log
+        msg (str): Message to log, optionally with %-style placeholders
+        *args: Arguments for lazy %-formatting, applied only if the
+               message is actually emitted at the current log level
     """
-    logger.critical(msg)
+    logger.critical(msg, *args)
 
 
 def configure_logger(name: str, level: Optional[str] = None, 
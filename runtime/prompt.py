@@ -4,15 +4,16 @@ This module provides utilities for generating prompts for mathematical problem
 solving, including collaborative problem-solving techniques and prompt formatting.
 """
 
-import sys
-import os
 import argparse
 from typing import List, Optional, Any, Dict
 
-# Get absolute path of project root directory
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-# Add project root directory to system path
-sys.path.append(project_root)
+# Prompt template for collaborative subtask distribution, parsed once at
+# import time instead of rebuilding the format structure per subtask.
+_COLLABORATIVE_PROMPT_TEMPLATE = (
+    "Base Problem: {base}\n"
+    "Subtask {i}: {sub}\n"
+    "Please solve this subtask and provide your answer."
+)
 
 
 def divide_and_collaborate(problem: str, model: Optional[Any] = None, 
@@ -135,17 +136,10 @@ def create_collaborative_prompt(base_problem: str,
     Returns:
         List[str]: List of formatted prompts for each subtask
     """
-    prompts = []
-    
-    for i, sub_task in enumerate(sub_tasks):
-        prompt = (
-            f"Base Problem: {base_problem}\n"
-            f"Subtask {i+1}: {sub_task}\n"
-            f"Please solve this subtask and provide your answer."
-        )
-        prompts.append(prompt)
-    
-    return prompts
+    return [
+        _COLLABORATIVE_PROMPT_TEMPLATE.format(base=base_problem, i=i, sub=sub_task)
+        for i, sub_task in enumerate(sub_tasks, 1)
+    ]
 
 
 def format_solution_response(solution: str, confidence: float = 1.0) -> Dict[str, Any]:
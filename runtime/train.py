@@ -10,6 +10,21 @@ import json
 import argparse
 from typing import Dict, Any, Optional
 
+# Prefer orjson's C-accelerated parser for config files, fallback to the
+# stdlib json module if not available
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+# Try to import msgspec so the training schema is validated in a single
+# C-level pass, fallback to the hand-coded checks if not available
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 # Get absolute path of project root directory
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 # Add project root directory to system path
@@ -33,26 +48,52 @@ def load_training_config(config_path: str) -> Dict[str, Any]:
         json.JSONDecodeError: If config file contains invalid JSON
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(config_path, 'rb') as f:
+            config = _loads(f.read())
         return config
     except FileNotFoundError:
         print(f"Error: Configuration file '{config_path}' not found")
         raise
-    except json.JSONDecodeError as e:
+    except (json.JSONDecodeError, ValueError) as e:
+        # orjson raises a plain ValueError subclass on malformed input
         print(f"Error: Invalid JSON in configuration file: {e}")
         raise
 
 
+if msgspec is not None:
+    class TrainingConfigSchema(msgspec.Struct):
+        """Schema for the fields required of a training configuration."""
+        model_name: str
+        dataset_path: str
+        output_dir: str
+        epochs: int = 10
+        learning_rate: float = 5e-5
+
+
 def validate_training_config(config: Dict[str, Any]) -> bool:
     """Validate training configuration parameters.
     
+    When msgspec is installed the schema compiled at import time checks
+    all fields in one pass; otherwise a hand-coded fallback runs the
+    same required-field and type checks.
+    
     Args:
         config (Dict[str, Any]): Configuration dictionary to validate
         
     Returns:
         bool: True if configuration is valid, False otherwise
     """
+    if msgspec is not None:
+        try:
+            msgspec.convert(
+                {k: v for k, v in config.items() if v is not None},
+                TrainingConfigSchema,
+            )
+            return True
+        except msgspec.ValidationError as e:
+            print(f"Error: Invalid training configuration: {e}")
+            return False
+
     required_fields = ['model_name', 'dataset_path', 'output_dir']
     
     for field in required_fields:
@@ -133,10 +174,11 @@ def main() -> None:
         if os.path.exists(args.config):
             config = load_training_config(args.config)
             
-            # Merge configuration into command line arguments
-            for key, value in config.items():
-                if not hasattr(args, key) or getattr(args, key) is None:
-                    setattr(args, key, value)
+            # Merge in one pass: explicit command line values override
+            # config file entries, config fills the rest
+            args_dict = vars(args)
+            merged = {**config, **{k: v for k, v in args_dict.items() if v is not None}}
+            args = argparse.Namespace(**merged)
         else:
             print(f"Warning: Config file '{args.config}' not found, "
                   f"using command line arguments only")
@@ -4,11 +4,70 @@ This module provides the main entry point for multi-agent task execution
 including task decomposition, agent discovery, and result aggregation.
 """
 
+import os
+import re
 import time
+import heapq
+import json
+import queue
+import atexit
+import hashlib
+import logging
+import logging.handlers
 import threading
+import concurrent.futures
+from collections import OrderedDict
 from typing import Dict, List, Any, Optional, Tuple
 from collections import Counter
 
+# Try to import numpy for vectorized agent discovery, fallback to the
+# pure-Python scan if not available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Maximum number of entries kept in the exact-match response cache
+RESPONSE_CACHE_SIZE = 1024
+
+# Maximum number of (agent, requirement) match scores memoized
+MATCH_CACHE_SIZE = 4096
+
+# Result prefixes that mark failed executions, checked in one C-level scan
+_ERR_PREFIXES = ('[ERROR]', '[AGENT_ERROR]')
+
+# A dedicated child logger: "symphony" itself belongs to runtime.logger,
+# and the queue route below must not capture that module's records
+log = logging.getLogger("symphony.orchestrator")
+
+_log_configured = False
+_log_configure_lock = threading.Lock()
+
+
+def _configure_logging() -> None:
+    """Route orchestrator log records through a queue, once per process.
+
+    Worker threads drop records into a lock-free SimpleQueue via a
+    QueueHandler; a single QueueListener thread drains them to stdout, so
+    the thread-pool fan-out never serializes on the stream lock.
+    """
+    global _log_configured
+    with _log_configure_lock:
+        if _log_configured:
+            return
+        record_queue = queue.SimpleQueue()
+        log.addHandler(logging.handlers.QueueHandler(record_queue))
+        log.setLevel(logging.INFO)
+        # The QueueListener already writes to the stream; without this,
+        # any root handler (e.g. from logging.basicConfig) would emit
+        # every record a second time via propagation
+        log.propagate = False
+        listener = logging.handlers.QueueListener(
+            record_queue, logging.StreamHandler()
+        )
+        listener.start()
+        _log_configured = True
+
 try:
     # Package mode imports
     from symphony.protocol.task_contract import Task, TaskResult
@@ -30,9 +89,21 @@ class SymphonyOrchestrator:
     
     def __init__(self):
         """Initialize the Symphony orchestrator."""
-        self.agents: List[Agent] = []
+        _configure_logging()
+        # Copy-on-write snapshot of registered agents: writers swap in a
+        # new tuple under the lock, readers iterate lock-free
+        self._agents_snapshot: Tuple[Agent, ...] = ()
+        self._agent_ids: set = set()
         self.active_tasks: Dict[str, Dict] = {}
         self.lock = threading.Lock()
+        # Exact-match LRU cache over agent responses, keyed by a hash of
+        # the canonical agent input
+        self._response_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        # Memoized capability match scores keyed by (agent identity, requirement)
+        self._match_cache: "OrderedDict[Tuple[int, str], float]" = OrderedDict()
+        # Long-lived executor for CoT fan-out, constructed lazily
+        self._pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
     
     def register_agent(self, agent: Agent) -> None:
         """Register an agent with the orchestrator.
@@ -40,10 +111,49 @@ class SymphonyOrchestrator:
         Args:
             agent: Agent instance to register
         """
+        # Double-checked membership: the O(1) set test outside the lock
+        # skips the critical section for already-registered agents
+        if agent.agent_id in self._agent_ids:
+            return
+        added = False
         with self.lock:
-            if agent not in self.agents:
-                self.agents.append(agent)
-                print(f"[ORCHESTRATOR] Registered agent: {agent.agent_id}")
+            if agent.agent_id not in self._agent_ids:
+                self._agent_ids.add(agent.agent_id)
+                self._agents_snapshot = self._agents_snapshot + (agent,)
+                # Drop any match scores memoized for a previous object
+                # that happened to share this id()
+                stale = [key for key in self._match_cache if key[0] == id(agent)]
+                for key in stale:
+                    del self._match_cache[key]
+                added = True
+        # stdout I/O stays outside the critical section
+        if added:
+            log.info("[ORCHESTRATOR] Registered agent: %s", agent.agent_id)
+
+    def _get_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the shared executor, creating it on first use.
+
+        A single pool is reused across execute_task calls so repeated
+        orchestration does not pay thread creation per task; it is shut
+        down at interpreter exit.
+
+        Returns:
+            The shared ThreadPoolExecutor instance
+        """
+        if self._pool is None:
+            with self.lock:
+                if self._pool is None:
+                    self._pool = concurrent.futures.ThreadPoolExecutor(
+                        max_workers=int(os.getenv("SYMPHONY_WORKERS", "16")),
+                        thread_name_prefix="symphony",
+                    )
+                    atexit.register(self._pool.shutdown, wait=False)
+        return self._pool
+
+    @property
+    def agents(self) -> List[Agent]:
+        """List view over the currently registered agents."""
+        return list(self._agents_snapshot)
     
     def execute_task(self, task: Task, cot_count: int = 3) -> str:
         """Execute a complex task using multi-agent coordination.
@@ -55,14 +165,21 @@ class SymphonyOrchestrator:
         Returns:
             Final result after voting
         """
-        print(f"[SYMPHONY] Starting task execution: {task.description[:50]}...")
+        log.info("[SYMPHONY] Starting task execution: %.50s...", task.description)
+        
+        # Resolve context fields once per task instead of per (subtask, agent) pair
+        domain = task.context.get('domain', 'general')
+        
+        # Fast path: with zero or one requirement there is nothing to decompose
+        if len(task.requirements) <= 1:
+            return self._fast_single_requirement(task, cot_count, domain)
         
         # Step 1: Decompose task into sub-tasks
-        subtasks = self._decompose_task(task)
-        print(f"[SYMPHONY] Task decomposed into {len(subtasks)} subtasks")
+        subtasks = self._decompose_task(task, domain)
+        log.info("[SYMPHONY] Task decomposed into %d subtasks", len(subtasks))
         
         # Step 2: Find suitable agents for each subtask
-        agent_assignments = self._find_suitable_agents(subtasks)
+        agent_assignments = self._find_suitable_agents(subtasks, cot_count)
         
         if not agent_assignments:
             return "[ERROR] No suitable agents found for task execution"
@@ -71,16 +188,53 @@ class SymphonyOrchestrator:
         results = self._execute_with_cot_voting(subtasks, agent_assignments, cot_count)
         
         # Step 4: Aggregate final result
-        final_result = self._aggregate_results(results, task)
+        final_result = self._aggregate_results(results, subtasks, task)
         
-        print(f"[SYMPHONY] Task execution completed")
+        log.info("[SYMPHONY] Task execution completed")
         return final_result
     
-    def _decompose_task(self, task: Task) -> List[Dict[str, Any]]:
+    def _fast_single_requirement(self, task: Task, cot_count: int,
+                                 domain: str) -> str:
+        """Execute a task with at most one requirement on the fast path.
+
+        Skips the per-requirement decomposition loop: a single subtask
+        dict is built inline and routed straight through discovery,
+        execution and aggregation.
+
+        Args:
+            task: Task with zero or one requirement
+            cot_count: Number of CoT executions for voting
+            domain: Task domain, resolved once by the caller
+
+        Returns:
+            Final result after voting
+        """
+        if not task.requirements:
+            return "[ERROR] No suitable agents found for task execution"
+
+        requirement = task.requirements[0]
+        subtask = {
+            'id': f"{task.task_id}_sub_1",
+            'requirement': requirement,
+            'description': f"Handle {requirement} for: {task.description}",
+            'context': task.context,
+            'domain': domain,
+            'original_task': task.description
+        }
+
+        assignments = self._find_suitable_agents([subtask], cot_count)
+        results = self._execute_with_cot_voting([subtask], assignments, cot_count)
+        final_result = self._aggregate_results(results, [subtask], task)
+
+        log.info("[SYMPHONY] Task execution completed")
+        return final_result
+
+    def _decompose_task(self, task: Task, domain: str = 'general') -> List[Dict[str, Any]]:
         """Decompose complex task into executable subtasks.
         
         Args:
             task: Complex task to decompose
+            domain: Task domain, resolved once by the caller
             
         Returns:
             List of subtask dictionaries
@@ -94,94 +248,241 @@ class SymphonyOrchestrator:
                 'requirement': requirement,
                 'description': f"Handle {requirement} for: {task.description}",
                 'context': task.context,
+                'domain': domain,
                 'original_task': task.description
             }
             subtasks.append(subtask)
         
         return subtasks
     
-    def _find_suitable_agents(self, subtasks: List[Dict]) -> Dict[str, List[Agent]]:
+    def _find_suitable_agents(self, subtasks: List[Dict],
+                              cot_count: int = 8) -> Dict[str, List[Agent]]:
         """Find suitable agents for each subtask based on capabilities.
         
         Args:
             subtasks: List of subtasks to assign
+            cot_count: Number of agents consumed per subtask downstream;
+                only the top cot_count matches are selected
             
         Returns:
             Dictionary mapping subtask IDs to list of suitable agents
         """
+        agents = self._agents_snapshot  # lock-free read of the snapshot
+        
+        if np is not None and agents and subtasks:
+            return self._find_suitable_agents_vectorized(subtasks, agents, cot_count)
+        
         assignments = {}
         
         for subtask in subtasks:
             suitable_agents = []
             requirement = subtask['requirement']
             
-            for agent in self.agents:
+            for agent in agents:
                 # Check if agent has matching capabilities
                 if hasattr(agent, 'capability_manager'):
-                    match_score = agent.capability_manager.match(requirement)
+                    match_score = self._cached_match(agent, requirement)
                     if match_score >= 0.3:  # Minimum threshold
                         suitable_agents.append((agent, match_score))
             
-            # Sort by match score (descending)
-            suitable_agents.sort(key=lambda x: x[1], reverse=True)
-            assignments[subtask['id']] = [agent for agent, score in suitable_agents]
+            # Partial selection: only the top cot_count agents are ever
+            # executed, so skip the full sort
+            top = heapq.nlargest(cot_count, suitable_agents, key=lambda x: x[1])
+            assignments[subtask['id']] = [agent for agent, score in top]
             
-            print(f"[ASSIGNMENT] Subtask '{requirement}': {len(suitable_agents)} suitable agents found")
+            log.info("[ASSIGNMENT] Subtask '%s': %d suitable agents found", requirement, len(suitable_agents))
         
         return assignments
     
+    def _find_suitable_agents_vectorized(self, subtasks: List[Dict],
+                                         agents: Tuple[Agent, ...],
+                                         cot_count: int) -> Dict[str, List[Agent]]:
+        """Vectorized agent discovery over a cached score matrix.
+
+        Builds the agents x requirements score matrix once, then does the
+        threshold filter and top-k selection per subtask as C-level numpy
+        operations instead of Python loops.
+
+        Args:
+            subtasks: List of subtasks to assign
+            agents: Snapshot of registered agents
+            cot_count: Number of agents selected per subtask
+
+        Returns:
+            Dictionary mapping subtask IDs to list of suitable agents
+        """
+        scorable = [agent for agent in agents if hasattr(agent, 'capability_manager')]
+        requirements = [subtask['requirement'] for subtask in subtasks]
+        assignments = {}
+
+        if scorable:
+            scores = np.fromiter(
+                (self._cached_match(agent, requirement)
+                 for agent in scorable for requirement in requirements),
+                dtype=np.float32,
+                count=len(scorable) * len(requirements),
+            ).reshape(len(scorable), len(requirements))
+
+        for j, subtask in enumerate(subtasks):
+            selected = []
+            suitable_count = 0
+            if scorable:
+                column = scores[:, j]
+                suitable = np.nonzero(column >= 0.3)[0]  # Minimum threshold
+                suitable_count = int(suitable.size)
+                if suitable_count:
+                    order = np.argsort(-column[suitable], kind='stable')[:cot_count]
+                    selected = [scorable[i] for i in suitable[order]]
+            assignments[subtask['id']] = selected
+
+            log.info("[ASSIGNMENT] Subtask '%s': %d suitable agents found", subtask['requirement'], suitable_count)
+
+        return assignments
+
+    def _cached_match(self, agent: Agent, requirement: str) -> float:
+        """Return the capability match score for an agent, memoized.
+
+        Requirements recur across tasks, so scores are cached per
+        (agent identity, requirement) pair with bounded LRU eviction.
+
+        Args:
+            agent: Agent whose capabilities to match
+            requirement: Requirement string to score
+
+        Returns:
+            Match score between 0.0 and 1.0
+        """
+        key = (id(agent), requirement)
+        score = self._match_cache.get(key)
+        if score is None:
+            score = agent.capability_manager.match(requirement)
+            self._match_cache[key] = score
+            while len(self._match_cache) > MATCH_CACHE_SIZE:
+                self._match_cache.popitem(last=False)
+        return score
+
     def _execute_with_cot_voting(self, subtasks: List[Dict], 
                                 agent_assignments: Dict[str, List[Agent]], 
                                 cot_count: int) -> Dict[str, str]:
         """Execute subtasks with Chain-of-Thought voting.
-        
+
+        All (subtask, agent) pairs are independent LLM calls, so they are
+        fanned out to a thread pool and gathered as they complete instead
+        of running serially.
+
         Args:
             subtasks: List of subtasks to execute
             agent_assignments: Agent assignments for each subtask
             cot_count: Number of CoT executions
-            
+
         Returns:
             Dictionary of subtask results
         """
-        results = {}
-        
+        cot_results: Dict[str, List[str]] = {subtask['id']: [] for subtask in subtasks}
+        single_results: Dict[str, str] = {}
+        pooled: List[Dict] = []
+
+        # Hoist the bound method so the loops below use a LOAD_FAST
+        # instead of repeated attribute lookups
+        execute = self._execute_subtask_on_agent
+
+        # With one agent (or one CoT) the vote is trivially determined;
+        # execute inline and skip the pool and voting machinery entirely
         for subtask in subtasks:
-            subtask_id = subtask['id']
-            available_agents = agent_assignments.get(subtask_id, [])
-            
+            available_agents = agent_assignments.get(subtask['id'], [])
             if not available_agents:
-                results[subtask_id] = f"[ERROR] No agents available for subtask: {subtask['requirement']}"
                 continue
-            
-            # Execute with multiple agents for CoT voting
-            cot_results = []
-            
-            for i in range(min(cot_count, len(available_agents))):
-                agent = available_agents[i]
+            if len(available_agents) == 1 or cot_count == 1:
+                agent = available_agents[0]
                 try:
-                    result = self._execute_subtask_on_agent(agent, subtask)
-                    cot_results.append(result)
-                    print(f"[COT] Agent {agent.agent_id}: Completed subtask {subtask['requirement']}")
+                    single_results[subtask['id']] = execute(agent, subtask)
+                    log.info("[COT] Agent %s: Completed subtask %s", agent.agent_id, subtask['requirement'])
                 except Exception as e:
-                    print(f"[COT] Agent {agent.agent_id}: Failed subtask {subtask['requirement']} - {str(e)}")
-                    cot_results.append(f"[AGENT_ERROR] {str(e)}")
-            
-            # Vote on results
-            if cot_results:
-                final_result = self._vote_on_results(cot_results, subtask)
-                results[subtask_id] = final_result
+                    log.info("[COT] Agent %s: Failed subtask %s - %s", agent.agent_id, subtask['requirement'], str(e))
+                    single_results[subtask['id']] = f"[AGENT_ERROR] {str(e)}"
+            else:
+                pooled.append(subtask)
+
+        # Fan out the remaining (subtask, agent) pairs on the shared pool;
+        # executions are independent
+        if pooled:
+            pool = self._get_pool()
+            futures = {}
+            for subtask in pooled:
+                available_agents = agent_assignments.get(subtask['id'], [])
+                for agent in available_agents[:cot_count]:
+                    future = pool.submit(execute, agent, subtask)
+                    futures[future] = (subtask, agent)
+
+            for future in concurrent.futures.as_completed(futures):
+                subtask, agent = futures[future]
+                try:
+                    result = future.result()
+                    cot_results[subtask['id']].append(result)
+                    log.info("[COT] Agent %s: Completed subtask %s", agent.agent_id, subtask['requirement'])
+                except Exception as e:
+                    log.info("[COT] Agent %s: Failed subtask %s - %s", agent.agent_id, subtask['requirement'], str(e))
+                    cot_results[subtask['id']].append(f"[AGENT_ERROR] {str(e)}")
+
+        # Vote on the gathered results, preserving subtask order
+        results = {}
+        for subtask in subtasks:
+            subtask_id = subtask['id']
+            if subtask_id in single_results:
+                results[subtask_id] = single_results[subtask_id]
+            elif not agent_assignments.get(subtask_id):
+                results[subtask_id] = f"[ERROR] No agents available for subtask: {subtask['requirement']}"
+            elif cot_results[subtask_id]:
+                results[subtask_id] = self._vote_on_results(cot_results[subtask_id], subtask)
             else:
                 results[subtask_id] = f"[ERROR] All agents failed for subtask: {subtask['requirement']}"
-        
+
         return results
     
     def _execute_subtask_on_agent(self, agent: Agent, subtask: Dict) -> str:
-        """Execute a subtask on a specific agent.
-        
+        """Execute a subtask on a specific agent, with exact-match caching.
+
+        Agent executions are pure functions of (agent, requirement,
+        description, context), so identical inputs are served from an LRU
+        cache instead of re-invoking the agent.
+
         Args:
             agent: Agent to execute the subtask
             subtask: Subtask to execute
-            
+
+        Returns:
+            Execution result
+        """
+        key = hashlib.sha256(json.dumps({
+            'aid': agent.agent_id,
+            'req': subtask['requirement'],
+            'desc': subtask['description'],
+            'ctx': subtask['context']
+        }, sort_keys=True).encode()).hexdigest()
+
+        with self._response_cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                return cached
+
+        result = self._run_subtask_on_agent(agent, subtask)
+
+        with self._response_cache_lock:
+            self._response_cache[key] = result
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+        return result
+
+    def _run_subtask_on_agent(self, agent: Agent, subtask: Dict) -> str:
+        """Invoke a subtask on an agent without consulting the cache.
+
+        Args:
+            agent: Agent to execute the subtask
+            subtask: Subtask to execute
+
         Returns:
             Execution result
         """
@@ -198,7 +499,7 @@ class SymphonyOrchestrator:
         # For testing, return a simulated result
         if hasattr(agent, 'base_model') and agent.base_model is None:
             # Test mode - return simulated result
-            return f"[SIMULATED] Agent {agent.agent_id} handling {subtask['requirement']}: Task analysis completed with focus on {subtask['context'].get('domain', 'general')} domain."
+            return f"[SIMULATED] Agent {agent.agent_id} handling {subtask['requirement']}: Task analysis completed with focus on {subtask['domain']} domain."
         
         # In real mode, this would execute the task on the agent
         try:
@@ -223,47 +524,61 @@ class SymphonyOrchestrator:
         if len(cot_results) == 1:
             return cot_results[0]
         
-        # Simple voting: choose the longest non-error result
-        valid_results = [r for r in cot_results if not r.startswith('[ERROR]') and not r.startswith('[AGENT_ERROR]')]
+        valid_results = [r for r in cot_results if not r.startswith(_ERR_PREFIXES)]
         
         if not valid_results:
             return cot_results[0]  # Return first result even if error
         
-        # Choose result with most content (simple heuristic)
-        best_result = max(valid_results, key=len)
+        # Plurality voting over whitespace/case-normalized fingerprints,
+        # as in self-consistency CoT; ties go to the earliest result
+        normalized = [re.sub(r'\s+', ' ', r.strip().lower()) for r in valid_results]
+        counts = Counter(normalized)
+        winner_norm, votes = counts.most_common(1)[0]
+        
+        best_result = valid_results[normalized.index(winner_norm)]
         
-        print(f"[VOTING] Selected result for {subtask['requirement']}: {len(best_result)} characters")
+        log.info("[VOTING] Selected result for %s: %d/%d votes", subtask['requirement'], votes, len(cot_results))
         return best_result
     
-    def _aggregate_results(self, results: Dict[str, str], original_task: Task) -> str:
+    def _aggregate_results(self, results: Dict[str, str], subtasks: List[Dict],
+                           original_task: Task) -> str:
         """Aggregate subtask results into final result.
         
         Args:
             results: Dictionary of subtask results
+            subtasks: Subtasks the results were produced for, in order
             original_task: Original task
             
         Returns:
             Final aggregated result
         """
-        aggregated = f"## Symphony Multi-Agent Task Execution Result\n\n"
-        aggregated += f"**Original Task**: {original_task.description}\n\n"
-        aggregated += f"**Domain**: {original_task.context.get('domain', 'General')}\n"
-        aggregated += f"**Complexity**: {original_task.context.get('complexity', 'Medium')}\n\n"
-        aggregated += f"### Subtask Results:\n\n"
+        # Assemble the report as chunks and join once; repeated += on a
+        # growing str copies the whole prefix each time
+        parts = [
+            f"## Symphony Multi-Agent Task Execution Result\n\n",
+            f"**Original Task**: {original_task.description}\n\n",
+            f"**Domain**: {original_task.context.get('domain', 'General')}\n",
+            f"**Complexity**: {original_task.context.get('complexity', 'Medium')}\n\n",
+            f"### Subtask Results:\n\n",
+        ]
         
-        for i, (subtask_id, result) in enumerate(results.items(), 1):
-            requirement = subtask_id.split('_sub_')[-1]
-            aggregated += f"{i}. **{requirement}**: {result}\n\n"
+        for i, subtask in enumerate(subtasks, 1):
+            result = results[subtask['id']]
+            parts.append(f"{i}. **{subtask['requirement']}**: {result}\n\n")
         
-        aggregated += f"\n**Execution Summary**: Successfully coordinated {len(results)} specialized agents "
-        aggregated += f"to handle different aspects of the task through beacon-guided routing and CoT voting.\n"
+        parts.append(f"\n**Execution Summary**: Successfully coordinated {len(results)} specialized agents ")
+        parts.append(f"to handle different aspects of the task through beacon-guided routing and CoT voting.\n")
         
-        return aggregated
+        return "".join(parts)
 
 
 # Global orchestrator instance
 _global_orchestrator = SymphonyOrchestrator()
 
+# Module-local alias so the entry points below reach the orchestrator
+# through a single global load
+_orch = _global_orchestrator
+
 
 def execute_task(task: Task, cot_count: int = 3) -> str:
     """Execute a complex task using Symphony's multi-agent coordination.
@@ -300,7 +615,7 @@ def execute_task(task: Task, cot_count: int = 3) -> str:
         >>> # Execute with multi-agent coordination
         >>> result = execute_task(task)
     """
-    return _global_orchestrator.execute_task(task, cot_count)
+    return _orch.execute_task(task, cot_count)
 
 
 def register_agent(agent: Agent) -> None:
@@ -309,7 +624,7 @@ def register_agent(agent: Agent) -> None:
     Args:
         agent: Agent instance to register
     """
-    _global_orchestrator.register_agent(agent)
+    _orch.register_agent(agent)
 
 
 def get_registered_agents() -> List[Agent]:
@@ -318,4 +633,4 @@ def get_registered_agents() -> List[Agent]:
     Returns:
         List of registered Agent instances
     """
-    return _global_orchestrator.agents.copy()
+    return list(_orch._agents_snapshot)
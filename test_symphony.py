@@ -6,8 +6,21 @@ This script tests the high-level API shown in the README.
 
 import sys
 import os
+import traceback
 sys.path.insert(0, '/workspace/code')
 
+# Traceback signatures already printed; repeated identical failures are
+# reported once instead of re-reading source files every time
+_tb_seen = set()
+
+
+def _print_tb(e):
+    """Print a failure traceback, deduplicating identical signatures."""
+    tb_text = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+    if tb_text not in _tb_seen:
+        _tb_seen.add(tb_text)
+        print(tb_text, end="")
+
 def test_basic_import():
     """Test basic imports work correctly."""
     print("[TEST] Testing basic imports...")
@@ -37,8 +50,7 @@ def test_basic_import():
         return True
     except Exception as e:
         print(f"❌ Basic import test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_tb(e)
         return False
 
 def test_symphony_integration():
@@ -89,8 +101,7 @@ def test_symphony_integration():
         return True
     except Exception as e:
         print(f"❌ Symphony integration test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_tb(e)
         return False
 
 def test_readme_example():
@@ -141,8 +152,7 @@ def test_readme_example():
         return True
     except Exception as e:
         print(f"❌ README example test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        _print_tb(e)
         return False
 
 def run_all_tests():
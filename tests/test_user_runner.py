@@ -0,0 +1,139 @@
+"""Test user runner voting behavior."""
+
+import queue
+import sys
+import os
+import threading
+import time
+from collections import deque
+
+# Add the parent directory to the path so we can import symphony
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from user_register import UserRunner
+
+
+class _FakeISEPClient:
+    """Queue-backed stand-in for the ISEP client."""
+
+    def __init__(self):
+        self.queue = queue.Queue()
+
+    def receive_result(self, timeout=None):
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return None, None, None
+
+
+class _FakeUser:
+    """Stand-in user that feeds a scripted answer sequence per task."""
+
+    def __init__(self, answers, delay=0.0):
+        self.user_id = "test_user"
+        self.isep_client = _FakeISEPClient()
+        self.answers = answers
+        self.delay = delay
+
+    def initiate_task(self, task_description):
+        def feed():
+            for idx, answer in enumerate(self.answers):
+                if self.delay:
+                    time.sleep(self.delay)
+                self.isep_client.queue.put((
+                    f"agent_{idx}", "task_result",
+                    {"result": answer, "previous_results": [answer]}
+                ))
+        threading.Thread(target=feed, daemon=True).start()
+
+
+def _make_runner(user, cot_num):
+    """Build a UserRunner around a fake user, skipping config loading."""
+    runner = UserRunner.__new__(UserRunner)
+    runner.user = user
+    runner.cot_num = cot_num
+    runner._single = cot_num == 1
+    runner.running = False
+    runner.answers = []
+    runner.full_answers = []
+    runner.final_result = ""
+    runner._inflight = deque()
+    runner._inflight_cond = threading.Condition()
+    runner._next_task = None
+    runner._presubmitted = None
+    runner._active = threading.Event()
+    runner._save_q = queue.Queue()
+    return runner
+
+
+class TestVoting:
+    """Test majority voting on CoT results."""
+
+    def test_early_leader_can_be_overtaken(self):
+        """The vote must not finalize while the leader can still lose.
+
+        With arrivals A, A, B, B, B the early leader A trails in the
+        full tally; the final result has to be B.
+        """
+        runner = _make_runner(_FakeUser(["A", "A", "B", "B", "B"]), cot_num=5)
+        runner.start()
+        final, _ = runner.process_task("problem")
+        runner.stop()
+        assert final == "B"
+
+    def test_strict_majority_finalizes_early(self):
+        """Three matching answers out of five decide the vote at arrival 3."""
+        runner = _make_runner(
+            _FakeUser(["A", "A", "A", "B", "B"], delay=0.05), cot_num=5
+        )
+        runner.start()
+        start = time.monotonic()
+        final, _ = runner.process_task("problem")
+        elapsed = time.monotonic() - start
+        runner.stop()
+        assert final == "A"
+        # Finalized at the third arrival, without waiting for the last two
+        assert elapsed < 0.05 * 5
+
+    def test_straggler_stays_out_of_next_task(self):
+        """Back-to-back tasks stay isolated despite an early finalize.
+
+        The first task finalizes on a strict majority before its last
+        answer arrives; the second task must neither lose one of its own
+        answers to the first task's drain nor inherit its straggler.
+        """
+        class ScriptedUser(_FakeUser):
+            def initiate_task(self, task_description):
+                feed = self.isep_client.queue.put
+
+                def run():
+                    if task_description == "first":
+                        for answer in ("X", "X"):
+                            feed(("a", "task_result",
+                                  {"result": answer, "previous_results": [answer]}))
+                        time.sleep(0.3)
+                        feed(("a", "task_result",
+                              {"result": "Y", "previous_results": ["Y"]}))
+                    else:
+                        for answer in ("P", "P", "Q"):
+                            feed(("b", "task_result",
+                                  {"result": answer, "previous_results": [answer]}))
+                threading.Thread(target=run, daemon=True).start()
+
+        runner = _make_runner(ScriptedUser([]), cot_num=3)
+        runner.start()
+        final_first, _ = runner.process_task("first")
+        final_second, full_second = runner.process_task("second")
+        runner.stop()
+        assert final_first == "X"
+        assert final_second == "P"
+        assert ["Y"] not in full_second
+
+    def test_unanimous_single_cot(self):
+        """cot_num=1 returns the lone answer directly."""
+        runner = _make_runner(_FakeUser(["42"]), cot_num=1)
+        runner.start()
+        final, full = runner.process_task("problem")
+        runner.stop()
+        assert final == "42"
+        assert full == [["42"]]
@@ -17,16 +17,67 @@ Author: Symphony Network Team
 License: MIT
 """
 
+import os
+import sys
 import time
+import logging
 import threading
 import json
+import queue
 import argparse
 from typing import List, Dict, Any, Tuple, Optional
-from collections import Counter
+from collections import deque
 
 from runtime.config import load_config_from_file
 from agents.user import User
 
+logger = logging.getLogger(__name__)
+
+# Prefer orjson's C-accelerated parser for task files, fallback to the
+# stdlib json module if not available
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one JSONL record to bytes, newline included."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        )
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_line(obj: Any) -> bytes:
+        """Serialize one JSONL record to bytes, newline included."""
+        return (json.dumps(obj, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+class _TaskState:
+    """
+    Per-task result accumulator with its own condition variable.
+
+    Each in-flight task gets one of these, so result arrivals for
+    different tasks synchronize on different locks and never contend.
+    """
+
+    __slots__ = ("task", "cond", "cot_num", "full_answers", "filled", "counts",
+                 "arrivals", "top_answer", "top_count", "final_result", "done")
+
+    def __init__(self, task: str, cot_num: int) -> None:
+        self.task = task
+        self.cond = threading.Condition()
+        self.cot_num = cot_num
+        # Capacity is known up front, so preallocate and fill by index
+        # instead of growing the list one append at a time
+        self.full_answers: List[Any] = [None] * cot_num
+        self.filled = 0
+        self.counts: Dict[str, int] = {}
+        self.arrivals = 0
+        self.top_answer: Optional[str] = None
+        self.top_count = 0
+        self.final_result = ""
+        self.done = False
+
 
 class UserRunner:
     """
@@ -42,11 +93,8 @@ class UserRunner:
         cot_num (int): Number of CoT executions for voting
         running (bool): Flag indicating if the runner is active
         answers (List[str]): Results of all completed tasks
-        current_answers (List[str]): Results from all CoTs of the current task
-        full_answers (List[Dict]): Detailed results including previous steps
-        result_event (threading.Event): Synchronization for result collection
-        lock (threading.Lock): Thread-safe result manipulation
-        final_result (str): The voted final result of current task
+        full_answers (List[Dict]): Detailed results of the last completed task
+        final_result (str): The voted final result of the last completed task
     """
     
     def __init__(self, config_path: str, cot_num: int) -> None:
@@ -68,15 +116,31 @@ class UserRunner:
         self.config = load_config_from_file(config_path)
         self.user = User(self.config, cot_num)
         self.cot_num = cot_num
+        # With a single CoT there is nothing to vote on; the result path
+        # skips the counter bookkeeping entirely
+        self._single = cot_num == 1
 
         self.running = False  # Running state flag
 
         self.answers: List[str] = []  # Results of all tasks
-        self.current_answers: List[str] = []  # Results from all CoTs of the current task
-        self.full_answers: List[Dict[str, Any]] = []  # Detailed results with previous steps
-        self.result_event = threading.Event()
-        self.lock = threading.Lock()  # Thread-safe result addition
+        self.full_answers: List[Dict[str, Any]] = []  # Detailed results of last task
         self.final_result: str = ""
+        # Per-task state, one entry per in-flight task, each with its own
+        # condition variable. Results carry no task identifier, so the
+        # listener attributes arrivals FIFO: each result goes to the
+        # oldest task that is still short of cot_num answers. The
+        # condition below guards the deque and pre-submit bookkeeping
+        # (never the per-result accumulation) and signals drains to the
+        # registration barrier in process_task.
+        self._inflight: deque = deque()
+        self._inflight_cond = threading.Condition()
+        self._next_task: Optional[str] = None
+        self._presubmitted: Optional[_TaskState] = None
+        # Set while any task is in flight; an idle runner parks the
+        # listener on this event instead of polling receive_result
+        self._active = threading.Event()
+        # Completed results queued for the background writer thread
+        self._save_q: "queue.Queue" = queue.Queue()
     
     def start(self) -> None:
         """
@@ -88,11 +152,16 @@ class UserRunner:
         the listener thread.
         """
         self.running = True
-        print(f"[STARTUP] User {self.user.user_id} started, listening for task results...")
+        logger.info("[STARTUP] User %s started, listening for task results...", self.user.user_id)
 
         # Start result listening thread
         result_thread = threading.Thread(target=self._listen_results, daemon=True)
         result_thread.start()
+
+        # Start background writer thread so serialization and file I/O
+        # overlap with the next task's network wait
+        writer_thread = threading.Thread(target=self._write_results, daemon=True)
+        writer_thread.start()
     
     def _listen_results(self) -> None:
         """
@@ -105,98 +174,330 @@ class UserRunner:
         The method implements thread-safe result aggregation and notifies
         waiting threads when the voting process is complete.
         """
+        receive = self.user.isep_client.receive_result
         while self.running:
-            try:
-                sender_id, msg_type, result = self.user.isep_client.receive_result(timeout=1)
-                if msg_type == "task_result":
-                    print(f"[RESULT] Received result from agent: {sender_id}")
-                    answer = result["result"]
-                    self.current_answers.append(answer)
-                    
-                    with self.lock:
-                        self.full_answers.append(result['previous_results'])
-                        print(f"[PROGRESS] Received {len(self.current_answers)}/{self.cot_num} answers")
-
-                        if len(self.current_answers) >= self.cot_num:
-                            self.final_result = self._vote_results()
-                            self.answers.append(self.final_result)
-                            print(f"[VOTING] Final result determined: {self.final_result}")
-                            print("[DETAILED_RESULTS] All Chain-of-Thought execution results:")
-                            for idx, detailed_result in enumerate(self.full_answers, 1):
-                                print(f"  CoT {idx}: {detailed_result}")
-                            self.result_event.set()
+            # Park on the activity gate while no task is in flight, so an
+            # idle runner does not spin polling the result queue
+            if not self._active.wait(timeout=0.5):
+                continue
+            # The blocking receive is the wait primitive: it parks the
+            # thread until a message arrives or the timeout elapses, so
+            # no additional sleep is needed between iterations.
+            sender_id, msg_type, result = receive(timeout=1)
+            if msg_type != "task_result":
+                continue
+
+            # Drain any further results already queued so the whole batch
+            # is processed in one pass
+            batch = [(sender_id, result)]
+            while True:
+                sender_id, msg_type, result = receive(timeout=0)
+                if msg_type != "task_result":
+                    break
+                batch.append((sender_id, result))
 
+            try:
+                for sender_id, result in batch:
+                    self._accumulate_result(sender_id, result)
             except Exception as e:
                 if self.running:
-                    print(f"[RESULT_ERROR] Failed to process result: {str(e)}")
-            time.sleep(0.2)
+                    logger.error("[RESULT_ERROR] Failed to process result: %s", e)
+
+    def _accumulate_result(self, sender_id: str, result: Dict[str, Any]) -> None:
+        """
+        Attribute one result to the oldest unfilled in-flight task.
 
-    def _vote_results(self) -> str:
+        Accumulation itself runs lock-free (this is the only thread that
+        writes the accumulators); the matched task's condition variable
+        is held only for the completion handshake. A task is
+        finalized as soon as its vote is mathematically decided (possibly
+        before every answer arrives); it stays in the in-flight deque
+        until all cot_num answers have drained so stragglers do not leak
+        into the next task; the queued next task is pre-submitted only
+        once that drain completes.
         """
-        Perform majority voting on the current answers.
+        logger.info("[RESULT] Received result from agent: %s", sender_id)
+        with self._inflight_cond:
+            state = self._inflight[0] if self._inflight else None
+        if state is None:
+            logger.warning("[RESULT] Dropping result with no task in flight")
+            return
+
+        answer = result["result"]
+        if isinstance(answer, str):
+            # Self-consistency answers repeat heavily; interning lets the
+            # counter-dict lookup short-circuit on pointer equality and
+            # dedupes the stored strings
+            answer = sys.intern(answer)
+        detailed_snapshot = None
+
+        if self._single:
+            # Single CoT: the one answer is the final answer. No counter,
+            # no leader tracking; the condition is only taken to wake the
+            # waiter.
+            state.full_answers = [result['previous_results']]
+            state.final_result = answer
+            self.answers.append(answer)
+            logger.info("[VOTING] Final result determined: %s", answer)
+            with state.cond:
+                state.arrivals = 1
+                state.done = True
+                state.cond.notify_all()
+            self._retire_and_presubmit(state, drained=True)
+            return
+
+        # The accumulators below are only ever touched from the single
+        # listener thread, so updating them needs no lock; the condition
+        # is held just long enough to publish the final result and wake
+        # the waiter
+        state.arrivals += 1
+        if not state.done:
+            state.full_answers[state.filled] = result['previous_results']
+            state.filled += 1
+            count = state.counts.get(answer, 0) + 1
+            state.counts[answer] = count
+            if count > state.top_count:
+                state.top_count = count
+                state.top_answer = answer
+            logger.info("[PROGRESS] Received %d/%d answers", state.arrivals, state.cot_num)
+
+            # Finalize once every answer is in, or early once the leader
+            # holds a strict majority of all cot_num votes — merely
+            # leading is not enough, since the outstanding answers could
+            # still overtake it. Early finalize is safe even with a
+            # successor queued: submission of the next task is deferred
+            # until this one's stragglers have drained, so the unlabeled
+            # result queue never interleaves two tasks.
+            remaining = state.cot_num - state.arrivals
+            if remaining <= 0 or state.top_count > state.cot_num // 2:
+                final_result = self._vote_results(state)
+                # Drop the unfilled tail before the waiter can see it
+                del state.full_answers[state.filled:]
+                if logger.isEnabledFor(logging.DEBUG):
+                    detailed_snapshot = list(state.full_answers)
+                with state.cond:
+                    state.final_result = final_result
+                    state.done = True
+                    state.cond.notify_all()
+                self.answers.append(final_result)
+                logger.info("[VOTING] Final result determined: %s", final_result)
+        drained = state.arrivals >= state.cot_num
+
+        self._retire_and_presubmit(state, drained)
+
+        if detailed_snapshot is not None:
+            logger.debug("[DETAILED_RESULTS] All Chain-of-Thought execution results:")
+            for idx, detailed_result in enumerate(detailed_snapshot, 1):
+                logger.debug("  CoT %d: %s", idx, detailed_result)
+
+    def _retire_and_presubmit(self, state: _TaskState, drained: bool) -> None:
+        """
+        Retire a drained task and pre-submit the next queued one.
+
+        Retiring pops the task from the in-flight deque so later arrivals
+        route to its successor, wakes the registration barrier in
+        process_task, and parks the listener when nothing is left in
+        flight. Pre-submission of the queued next task happens only at
+        the drain: results carry no task id, so a successor must not
+        enter flight while unlabeled stragglers are still outstanding.
+        """
+        if not drained:
+            return
+
+        next_task = None
+        with self._inflight_cond:
+            if self._inflight and self._inflight[0] is state:
+                self._inflight.popleft()
+            if state.done:
+                next_task = self._next_task
+                self._next_task = None
+                if next_task is not None:
+                    next_state = _TaskState(next_task, self.cot_num)
+                    self._inflight.append(next_state)
+                    self._presubmitted = next_state
+            if not self._inflight:
+                # Nothing left in flight: park the listener
+                self._active.clear()
+            self._inflight_cond.notify_all()
+        if next_task is not None:
+            # Submit off the listener thread: initiate_task blocks for
+            # the beacon-response window, which would stall all result
+            # processing here
+            threading.Thread(
+                target=self._presubmit, args=(next_task, next_state),
+                daemon=True
+            ).start()
+
+    def _presubmit(self, next_task: str, next_state: _TaskState) -> None:
+        """
+        Submit a pre-queued task, rolling back its state on failure.
+
+        If initiate_task raises (e.g. executor discovery fails), the
+        pre-registered state is withdrawn so process_task submits the
+        task itself; if process_task has already adopted the state, the
+        waiter is woken with an error result instead of sitting out the
+        full timeout on a task that was never submitted.
+        """
+        try:
+            self.user.initiate_task(next_task)
+        except Exception as e:
+            logger.error("[PRESUBMIT_ERROR] Failed to pre-submit task: %s", e)
+            with self._inflight_cond:
+                adopted = self._presubmitted is not next_state
+                if not adopted:
+                    self._presubmitted = None
+                try:
+                    self._inflight.remove(next_state)
+                except ValueError:
+                    pass
+                if not self._inflight:
+                    self._active.clear()
+                self._inflight_cond.notify_all()
+            if adopted:
+                with next_state.cond:
+                    del next_state.full_answers[next_state.filled:]
+                    next_state.final_result = f"[ERROR] {e}"
+                    next_state.done = True
+                    next_state.cond.notify_all()
+
+    def _vote_results(self, state: _TaskState) -> str:
+        """
+        Perform majority voting on one task's answers.
         
         This method implements a simple majority voting mechanism to determine
         the best answer from multiple Chain-of-Thought executions. In case of
         ties, it returns the first most common answer.
         
+        Args:
+            state (_TaskState): The task whose answers are being voted on
+        
         Returns:
             str: The answer that received the most votes
             
         Note:
             If all answers are unique, returns the first answer received.
         """
-        if not self.current_answers:
+        if state.top_answer is None:
             return "[NO_ANSWERS]"
-            
-        count = Counter(self.current_answers)
-        most_common = count.most_common(1)[0]  # Returns format like ('result', 3)
         
         # Log voting details for transparency
-        if len(count) > 1:
-            print(f"[VOTING_DETAILS] Answer distribution: {dict(count)}")
+        if len(state.counts) > 1:
+            logger.info("[VOTING_DETAILS] Answer distribution: %s", state.counts)
         else:
-            print("[VOTING_DETAILS] All answers were identical")
+            logger.info("[VOTING_DETAILS] All answers were identical")
             
-        return most_common[0]
+        return state.top_answer
     
-    def process_task(self, task_description: str) -> Tuple[str, List[Dict[str, Any]]]:
+    def process_task(self, task_description: str,
+                     next_task: Optional[str] = None) -> Tuple[str, List[Dict[str, Any]]]:
         """
         Process a single task and return the voted result.
-        
+
         This method orchestrates the execution of a single task by:
-        1. Clearing previous state
-        2. Assigning the task to the network
-        3. Waiting for results with timeout
+        1. Registering a fresh per-task state
+        2. Assigning the task to the network (unless the listener already
+           pre-submitted it while finishing the previous task)
+        3. Waiting on the task's own condition variable with timeout
         4. Returning the voted result and detailed answers
-        
+
         Args:
             task_description (str): The task to be executed
-            
+            next_task (Optional[str]): The following task's description, if
+                any; the listener pre-submits it as soon as this task's
+                results are in, overlapping network wait with voting/saving
+
         Returns:
             Tuple[str, List[Dict[str, Any]]]: Final result and detailed execution logs
-            
+
         Note:
             This method blocks until all CoT executions complete or timeout occurs.
         """
-        self.result_event.clear()
-        self.user.initiate_task(task_description)
-
-        def timeout_handler() -> None:
-            """Handle task timeout by setting a timeout result."""
-            if not self.result_event.is_set():
-                print("[TIMEOUT] Task execution exceeded 5 minutes, marking as timeout")
-                self.final_result = "[TIMEOUT]"
-                self.result_event.set()
-        
-        # Set up 5-minute timeout
-        timer = threading.Timer(300, timeout_handler)
-        timer.start()
+        submitted = False
+        drain_deadline = None
+        with self._inflight_cond:
+            while True:
+                state = self._presubmitted
+                if state is not None and state.task == task_description:
+                    # The listener already submitted this one while
+                    # wrapping up the previous task
+                    self._presubmitted = None
+                    submitted = True
+                    break
+                if not self._inflight:
+                    state = _TaskState(task_description, self.cot_num)
+                    self._inflight.append(state)
+                    break
+                # Drain barrier: results carry no task id, so a new task
+                # must not enter flight while a previous one still has
+                # unlabeled stragglers outstanding. Force-retire a task
+                # whose stragglers never arrive rather than wedging the
+                # runner on it.
+                if drain_deadline is None:
+                    drain_deadline = time.monotonic() + 30
+                remaining = drain_deadline - time.monotonic()
+                if remaining <= 0:
+                    stale = self._inflight.popleft()
+                    stale.done = True
+                    logger.warning(
+                        "[DRAIN] Retiring stalled task with %d/%d answers",
+                        stale.arrivals, stale.cot_num
+                    )
+                    continue
+                self._inflight_cond.wait(timeout=remaining)
+            self._next_task = next_task
+        self._active.set()
+        if not submitted:
+            try:
+                self.user.initiate_task(task_description)
+            except Exception:
+                # Withdraw the registered state so later tasks' results
+                # don't route into a task that was never submitted
+                with self._inflight_cond:
+                    try:
+                        self._inflight.remove(state)
+                    except ValueError:
+                        pass
+                    if not self._inflight:
+                        self._active.clear()
+                    self._inflight_cond.notify_all()
+                raise
+
+        # 5-minute timeout folded into the condition wait as a deadline,
+        # instead of spawning a Timer thread per task
+        deadline = time.monotonic() + 300
+
+        logger.info("[WAITING] Waiting for task results to return...")
+        with state.cond:
+            while not state.done:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning("[TIMEOUT] Task execution exceeded 5 minutes, marking as timeout")
+                    # Retire the dead task: mark it done so the listener
+                    # stops counting into it, and pop it from the FIFO so
+                    # later results route to the next task instead of
+                    # poisoning this one's tally
+                    state.done = True
+                    with self._inflight_cond:
+                        try:
+                            self._inflight.remove(state)
+                        except ValueError:
+                            pass
+                        if not self._inflight:
+                            self._active.clear()
+                        self._inflight_cond.notify_all()
+                    self.final_result = "[TIMEOUT]"
+                    # Only the filled slots, not the preallocated tail
+                    return self.final_result, state.full_answers[:state.filled]
+                state.cond.wait(timeout=remaining)
 
-        print("[WAITING] Waiting for task results to return...")
-        self.result_event.wait()
-        timer.cancel()
+        # Drop the activity gate once nothing is left in flight
+        with self._inflight_cond:
+            if not self._inflight:
+                self._active.clear()
 
-        return self.final_result, self.full_answers
+        self.final_result = state.final_result
+        self.full_answers = state.full_answers
+        return state.final_result, state.full_answers
     
     def process_task_batch(self, tasks: List[Dict[str, Any]], output_path: str, 
                           max_tasks: Optional[int] = None) -> None:
@@ -221,22 +522,25 @@ class UserRunner:
         processed_count = 0
         max_process = max_tasks or len(tasks)
         
-        print(f"[BATCH_START] Processing {min(max_process, len(tasks))} tasks...")
+        logger.info("[BATCH_START] Processing %d tasks...", min(max_process, len(tasks)))
         
         for index, task_item in enumerate(tasks):
             if processed_count >= max_process:
                 break
                 
-            # Reset state for new task
-            self.current_answers = []
-            self.full_answers = []
-            self.final_result = ""
-            
             task_description = task_item['problem']
-            print(f"[TASK_{index + 1}] Processing: {task_description[:100]}...")
-            
+            # Queue the following task so the listener pre-submits it while
+            # this one is being voted on and saved; the listener also owns
+            # resetting the per-task accumulators at each handoff
+            next_task = None
+            if index + 1 < len(tasks) and processed_count + 1 < max_process:
+                next_task = tasks[index + 1]['problem']
+            logger.info("[TASK_%d] Processing: %.100s...", index + 1, task_description)
+
             try:
-                final_answer, full_answers = self.process_task(task_description)
+                final_answer, full_answers = self.process_task(
+                    task_description, next_task=next_task
+                )
                 
                 result_item = {
                     "unique_id": task_item['unique_id'],
@@ -245,17 +549,17 @@ class UserRunner:
                 }
                 tasks_to_save.append(result_item)
                 
-                print(f"[TASK_{index + 1}] Completed with result: {final_answer}")
+                logger.info("[TASK_%d] Completed with result: %s", index + 1, final_answer)
                 processed_count += 1
                 
                 # Save results every 5 tasks to prevent data loss
                 if processed_count % 5 == 0:
                     self._save_batch_results(tasks_to_save, output_path)
-                    print(f"[CHECKPOINT] Saved {processed_count} completed tasks")
+                    logger.info("[CHECKPOINT] Saved %d completed tasks", processed_count)
                     tasks_to_save = []
                     
             except Exception as e:
-                print(f"[TASK_ERROR] Failed to process task {index + 1}: {str(e)}")
+                logger.error("[TASK_ERROR] Failed to process task %d: %s", index + 1, e)
                 # Add error result to maintain consistency
                 error_result = {
                     "unique_id": task_item['unique_id'],
@@ -265,40 +569,84 @@ class UserRunner:
                 tasks_to_save.append(error_result)
                 processed_count += 1
         
-        # Save any remaining results
+        # Save any remaining results and wait for the writer to catch up
         if tasks_to_save:
             self._save_batch_results(tasks_to_save, output_path)
+        self.flush_results()
             
-        print(f"[BATCH_COMPLETE] All {processed_count} tasks completed. Results saved to {output_path}")
+        logger.info("[BATCH_COMPLETE] All %d tasks completed. Results saved to %s", processed_count, output_path)
     
     def _save_batch_results(self, results: List[Dict[str, Any]], output_path: str) -> None:
         """
-        Save batch results to file in JSONL format.
+        Queue batch results for the background writer thread.
+        
+        Serialization and file I/O happen off the task-processing path;
+        call flush_results() to block until queued writes have landed.
         
         Args:
             results (List[Dict[str, Any]]): Results to save
             output_path (str): Path to the output file
-            
-        Raises:
-            IOError: If file writing fails
         """
+        self._save_q.put((output_path, list(results)))
+    
+    def _write_results(self) -> None:
+        """
+        Drain queued results and append them to disk in JSONL format.
+        
+        Runs in a dedicated daemon thread; a None sentinel shuts it down.
+        The output file descriptor is opened once and reused across
+        checkpoints; each checkpoint's records are joined into a single
+        buffer and appended with one os.write call rather than one write
+        per record.
+        """
+        out_fd = None
+        out_path = None
         try:
-            with open(output_path, 'a', encoding='utf-8') as f:
-                for result in results:
-                    f.write(json.dumps(result, ensure_ascii=False) + "\n")
-        except IOError as e:
-            print(f"[SAVE_ERROR] Failed to save results: {str(e)}")
-            raise
+            while True:
+                item = self._save_q.get()
+                try:
+                    if item is None:  # Shutdown sentinel
+                        break
+                    output_path, results = item
+                    try:
+                        if out_fd is None or output_path != out_path:
+                            if out_fd is not None:
+                                os.close(out_fd)
+                            out_fd = os.open(
+                                output_path,
+                                os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+                                0o644
+                            )
+                            out_path = output_path
+                        buf = b"".join(_dumps_line(result) for result in results)
+                        os.write(out_fd, buf)
+                    except IOError as e:
+                        logger.error("[SAVE_ERROR] Failed to save results: %s", e)
+                finally:
+                    self._save_q.task_done()
+        finally:
+            if out_fd is not None:
+                os.close(out_fd)
+    
+    def flush_results(self) -> None:
+        """
+        Block until every queued result has been written to disk.
+        """
+        self._save_q.join()
     
     def stop(self) -> None:
         """
         Gracefully stop the user runner.
         
         This method sets the running flag to False, which causes all
-        background threads to terminate gracefully.
+        background threads to terminate gracefully. The activity gate is
+        raised so an idle listener notices the flag promptly instead of
+        waiting out its park timeout.
         """
         self.running = False
-        print("[SHUTDOWN] User runner stopping...")
+        self._active.set()  # Unblock an idle listener immediately
+        self._save_q.put(None)  # Wake and stop the writer thread
+        logger.info("[SHUTDOWN] User runner stopping...")
 
 
 def load_tasks_from_jsonl(file_path: str) -> List[Dict[str, Any]]:
@@ -316,18 +664,42 @@ def load_tasks_from_jsonl(file_path: str) -> List[Dict[str, Any]]:
         json.JSONDecodeError: If the file format is invalid
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            tasks = [json.loads(line) for line in f if line.strip()]
-        print(f"[LOADER] Successfully loaded {len(tasks)} tasks from {file_path}")
+        with open(file_path, 'rb') as f:
+            tasks = [_loads(line) for line in f if line.strip()]
+        logger.info("[LOADER] Successfully loaded %d tasks from %s", len(tasks), file_path)
         return tasks
     except FileNotFoundError:
-        print(f"[LOADER_ERROR] Task file not found: {file_path}")
+        logger.error("[LOADER_ERROR] Task file not found: %s", file_path)
         raise
-    except json.JSONDecodeError as e:
-        print(f"[LOADER_ERROR] Invalid JSON format in {file_path}: {str(e)}")
+    except (json.JSONDecodeError, ValueError) as e:
+        # orjson raises a plain ValueError subclass on malformed input
+        logger.error("[LOADER_ERROR] Invalid JSON format in %s: %s", file_path, e)
         raise
 
 
+def iter_tasks_from_jsonl(file_path: str):
+    """
+    Stream tasks from a JSONL file one at a time.
+    
+    Unlike load_tasks_from_jsonl this does not hold the full task list in
+    memory, which matters for large batch files.
+    
+    Args:
+        file_path (str): Path to the JSONL file
+        
+    Yields:
+        Dict[str, Any]: One task per non-empty line
+        
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file format is invalid
+    """
+    with open(file_path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
 def main() -> None:
     """
     Main entry point for the user runner application.
@@ -358,7 +730,14 @@ Examples:
         help="Number of Chain-of-Thought answers needed for voting (minimum: 1)"
     )
     args = parser.parse_args()
-    
+
+    # Module logs use lazy %-formatting; at WARNING level the info-level
+    # per-result messages cost only an enabled-check
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
+    )
+
     if args.cot_num < 1:
         print("[ERROR] CoT number must be at least 1")
         return